@@ -64,7 +64,6 @@ async def health_check():
 @router.get("/files/{file_path:path}")
 async def serve_file(file_path: str):
     """serve binary files from the content directory."""
-    import os
     from pathlib import Path
 
     # construct the full path to the file
@@ -2,9 +2,9 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
 from .api import router
+from .services import StaticAssets
 
 app = FastAPI(title="cmd michael", description="a command prompt style personal website", version="1.0.0")
 
@@ -20,8 +20,8 @@ app.add_middleware(
 # include api routes
 app.include_router(router, prefix="/api/v1")
 
-# TODO fix... this is a hack to serve the frontend static files
-app.mount("/", StaticFiles(directory="app/static", html=True), name="static")
+# serve the vite build: immutable caching for hashed assets, precompressed variants and spa fallback
+app.mount("/", StaticAssets(directory="app/static"), name="static")
 
 
 @app.get("/")
@@ -1,4 +1,5 @@
 from .commands import CommandService
 from .filesystem import FileSystemService
+from .static_assets import StaticAssets
 
-__all__ = ["FileSystemService", "CommandService"]
+__all__ = ["FileSystemService", "CommandService", "StaticAssets"]
@@ -4,8 +4,6 @@ import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import markdown
-
 from ..models.filesystem import CommandResult, FileSystemNode, FileType
 
 
@@ -213,7 +211,10 @@ this is a cool project i built. it does amazing things.
             # replace markdown image syntax with HTML img tags
             content = re.sub(r"!\[([^\]]*)\]\(([^)]+)\)", replace_image_path, content)
 
-            # convert the rest to HTML
+            # convert the rest to HTML. markdown is imported here rather than at module
+            # level so startup doesn't pay for it until the first .md file is read
+            import markdown
+
             html_content = markdown.markdown(content)
             return CommandResult(success=True, output=html_content)
 
@@ -0,0 +1,184 @@
+"""static asset serving for the vite frontend build."""
+
+import hashlib
+import mimetypes
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+
+# vite emits hashed bundles as `[assetsDir]/[name]-[hash].[ext]` with an 8 character base64url hash
+HASHED_FILENAME = re.compile(r"-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+
+# precompressed siblings generated at build time, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@dataclass
+class AssetVariant:
+    """one encoding of a static asset (identity, br or gzip)."""
+
+    path: Path
+    stat_result: os.stat_result
+    etag: str
+    content: Optional[bytes] = None  # set when the variant is small enough to keep in memory
+
+
+@dataclass
+class StaticAsset:
+    """a static asset and its precompressed variants."""
+
+    media_type: str
+    cache_control: str
+    variants: Dict[str, AssetVariant] = field(default_factory=dict)  # keyed by content-encoding, "" for identity
+
+
+class StaticAssets:
+    """asgi app serving a vite build with fingerprinted caching and precompression.
+
+    the directory is scanned once at startup so requests never touch the filesystem for
+    lookups. hashed files under `assets_dir` (vite's `build.assetsDir`) get an immutable
+    cache-control, `.br`/`.gz` siblings are served when the client accepts them, small files
+    are kept in memory and unknown routes fall back to a short-ttl index.html so the
+    client-side app can handle them. paths whose first segment is in `no_fallback` (the api
+    and fastapi docs) never fall back, so a missing endpoint stays a 404.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        index: str = "index.html",
+        assets_dir: str = "assets",
+        no_fallback: Tuple[str, ...] = ("api", "docs", "redoc", "openapi.json"),
+        max_memory_size: int = 256 * 1024,
+        max_age: int = 60,
+    ):
+        self.directory = Path(directory)
+        self.index = index
+        self.assets_dir = assets_dir.strip("/") + "/"
+        self.no_fallback = no_fallback
+        self.max_memory_size = max_memory_size
+        self.max_age = max_age
+        self.assets = self._scan()
+
+    def _scan(self) -> Dict[str, StaticAsset]:
+        """index every file in the build directory by its url path."""
+        assets: Dict[str, StaticAsset] = {}
+        if not self.directory.is_dir():
+            return assets
+
+        files = {str(p.relative_to(self.directory).as_posix()): p for p in self.directory.rglob("*") if p.is_file()}
+        for name, path in files.items():
+            if any(name.endswith(suffix) and name[: -len(suffix)] in files for _, suffix in ENCODINGS):
+                continue  # precompressed sibling, attached to its original below
+
+            media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            if name.startswith(self.assets_dir) and HASHED_FILENAME.search(name):
+                cache_control = IMMUTABLE_CACHE_CONTROL
+            else:
+                cache_control = f"public, max-age={self.max_age}, must-revalidate"
+
+            asset = StaticAsset(media_type=media_type, cache_control=cache_control)
+            asset.variants[""] = self._load_variant(path, "")
+            for encoding, suffix in ENCODINGS:
+                sibling = files.get(name + suffix)
+                if sibling is not None:
+                    asset.variants[encoding] = self._load_variant(sibling, encoding)
+            assets[name] = asset
+
+        return assets
+
+    def _load_variant(self, path: Path, encoding: str) -> AssetVariant:
+        """stat a file once and read it into memory if it is small enough."""
+        stat_result = path.stat()
+        content = None
+        if stat_result.st_size <= self.max_memory_size:
+            content = path.read_bytes()
+            digest = hashlib.md5(content).hexdigest()
+        else:
+            digest = hashlib.md5(f"{stat_result.st_mtime}-{stat_result.st_size}".encode()).hexdigest()
+
+        # each encoding needs its own etag since the bytes on the wire differ
+        etag = f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+        return AssetVariant(path=path, stat_result=stat_result, etag=etag, content=content)
+
+    def _lookup(self, path: str) -> Optional[StaticAsset]:
+        """resolve a url path to an asset, falling back to index.html for client-side routes."""
+        path = path.lstrip("/")
+        if path == "" or path.endswith("/"):
+            asset = self.assets.get(path + self.index)
+        else:
+            asset = self.assets.get(path)
+        if asset is not None:
+            return asset
+
+        if path.split("/", 1)[0] in self.no_fallback:
+            return None
+
+        # only paths that look like routes fall back; a missing .js or .css should 404
+        if path.endswith("/") or "." not in path.rsplit("/", 1)[-1]:
+            return self.assets.get(self.index)
+        return None
+
+    def _accepted_encodings(self, headers: Headers) -> List[str]:
+        """encodings the client accepts; q-values only matter for explicitly refusing with q=0."""
+        accepted = []
+        for part in headers.get("accept-encoding", "").split(","):
+            token, _, params = part.partition(";")
+            name, _, value = params.partition("=")
+            if name.strip() == "q":
+                try:
+                    if float(value) == 0:
+                        continue
+                except ValueError:
+                    continue
+            accepted.append(token.strip().lower())
+        return accepted
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """serve a request for a static asset."""
+        assert scope["type"] == "http"
+
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+
+        asset = self._lookup(scope["path"])
+        if asset is None:
+            raise HTTPException(status_code=404)
+
+        request_headers = Headers(scope=scope)
+        accepted = self._accepted_encodings(request_headers)
+        encoding = next((e for e, _ in ENCODINGS if e in asset.variants and e in accepted), "")
+        variant = asset.variants[encoding]
+
+        headers = {"cache-control": asset.cache_control, "etag": variant.etag}
+        if len(asset.variants) > 1:
+            headers["vary"] = "Accept-Encoding"
+        if encoding:
+            headers["content-encoding"] = encoding
+
+        if_none_match = request_headers.get("if-none-match", "")
+        if variant.etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+            response: Response = Response(status_code=304, headers=headers)
+        elif variant.content is not None:
+            headers["content-length"] = str(len(variant.content))
+            body = b"" if scope["method"] == "HEAD" else variant.content
+            response = Response(body, headers=headers, media_type=asset.media_type)
+        else:
+            response = FileResponse(
+                variant.path,
+                headers=headers,
+                media_type=asset.media_type,
+                stat_result=variant.stat_result,
+                method=scope["method"],
+            )
+
+        await response(scope, receive, send)
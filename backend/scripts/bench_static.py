@@ -0,0 +1,165 @@
+"""benchmark frontend asset serving: starlette's StaticFiles vs StaticAssets.
+
+drives both asgi apps in-process (no network or server) with the requests a browser
+makes for one page load and reports requests per second plus bytes transferred on a
+first visit and on a repeat visit with a warm cache.
+
+usage (from the backend directory):
+    python scripts/bench_static.py [--directory app/static] [--seconds 3]
+
+when the directory has no index.html a synthetic vite-like build is generated.
+"""
+
+import argparse
+import asyncio
+import gzip
+import os
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from starlette.staticfiles import StaticFiles
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services import StaticAssets  # noqa: E402
+
+BROWSER_HEADERS = {"accept": "*/*", "accept-encoding": "gzip, deflate, br"}
+
+
+async def fetch(app, path: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], int]:
+    """issue a GET against an asgi app and return (status, response headers, body bytes)."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    status = 0
+    response_headers: Dict[str, str] = {}
+    size = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status, size
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update((k.decode(), v.decode()) for k, v in message["headers"])
+        elif message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, response_headers, size
+
+
+def page_resources(directory: Path) -> List[str]:
+    """the url paths a browser requests for one page load: index.html and what it references."""
+    html = (directory / "index.html").read_text()
+    refs = re.findall(r'(?:src|href)="(/[^"]+)"', html)
+    return ["/"] + [ref for ref in refs if (directory / ref.lstrip("/")).is_file()]
+
+
+async def page_load(app, resources: List[str], cache: Optional[Dict[str, Dict[str, str]]] = None) -> Tuple[int, int]:
+    """load every resource once, honouring a browser-like cache; returns (requests, bytes)."""
+    requests = 0
+    transferred = 0
+    for path in resources:
+        headers = dict(BROWSER_HEADERS)
+        cached = cache.get(path) if cache is not None else None
+        if cached is not None:
+            if "immutable" in cached.get("cache-control", ""):
+                continue  # served from the browser cache without a request
+            if "etag" in cached:
+                headers["if-none-match"] = cached["etag"]
+
+        status, response_headers, size = await fetch(app, path, headers)
+        assert status in (200, 304), f"{path} returned {status}"
+        requests += 1
+        transferred += size
+        if cache is not None and status == 200:
+            cache[path] = response_headers
+    return requests, transferred
+
+
+async def bench(name: str, app, resources: List[str], seconds: float) -> None:
+    """report bytes per page load and sustained requests per second for one app."""
+    _, cold_bytes = await page_load(app, resources)
+    cache: Dict[str, Dict[str, str]] = {}
+    await page_load(app, resources, cache)
+    warm_requests, warm_bytes = await page_load(app, resources, cache)
+
+    requests = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        done, _ = await page_load(app, resources)
+        requests += done
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{name:<14} {requests / elapsed:>10.0f} req/s  "
+        f"first visit {cold_bytes:>9,} B  repeat visit {warm_bytes:>7,} B in {warm_requests} request(s)"
+    )
+
+
+def synthetic_build(directory: Path) -> None:
+    """write a vite-shaped build (hashed js/css, index.html) with precompressed siblings."""
+    assets = directory / "assets"
+    assets.mkdir(parents=True)
+    js = "".join(f"function f{i}(a,b){{return a+b*{i}}};export const v{i}=f{i}({i},2);\n" for i in range(4000))
+    css = "".join(f".c{i}{{color:#{i % 4096:03x};margin:{i % 16}px}}\n" for i in range(400))
+    (assets / "index-4f1b2c3d.js").write_text(js)
+    (assets / "index-9a8b7c6d.css").write_text(css)
+    (directory / "vite.svg").write_text('<svg xmlns="http://www.w3.org/2000/svg" width="32" height="32"/>')
+    (directory / "index.html").write_text(
+        '<!doctype html><html><head><link rel="icon" href="/vite.svg" />'
+        '<script type="module" crossorigin src="/assets/index-4f1b2c3d.js"></script>'
+        '<link rel="stylesheet" href="/assets/index-9a8b7c6d.css"></head>'
+        '<body><div id="root"></div></body></html>\n' + "<!-- padding -->\n" * 100
+    )
+
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+    for path in [p for p in directory.rglob("*") if p.suffix in (".html", ".js", ".css")]:
+        data = path.read_bytes()
+        Path(f"{path}.gz").write_bytes(gzip.compress(data, compresslevel=9))
+        if brotli is not None:
+            Path(f"{path}.br").write_bytes(brotli.compress(data))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--directory", default="app/static", help="vite build directory (default: app/static)")
+    parser.add_argument("--seconds", type=float, default=3.0, help="duration of each throughput run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(args.directory)
+        if not (directory / "index.html").is_file():
+            directory = Path(tmp)
+            synthetic_build(directory)
+            print(f"no build in {args.directory}, using a synthetic one")
+
+        resources = page_resources(directory)
+        print(f"page load: {', '.join(resources)}")
+        asyncio.run(bench("StaticFiles", StaticFiles(directory=os.fspath(directory), html=True), resources, args.seconds))
+        asyncio.run(bench("StaticAssets", StaticAssets(directory=os.fspath(directory)), resources, args.seconds))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
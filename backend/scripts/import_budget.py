@@ -0,0 +1,101 @@
+"""startup import-time report with a budget check.
+
+runs `python -X importtime -c "import app.main"` in a fresh interpreter, prints the
+slowest top-level imports and exits non-zero when total import time goes over budget.
+
+usage (from the backend directory):
+    python scripts/import_budget.py [--budget-ms 600] [--runs 5] [--top 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", "600"))
+
+# modules that should never be imported at startup; they are loaded lazily on first use
+FORBIDDEN_AT_STARTUP = ("markdown", "yaml", "jinja2", "multipart", "dotenv")
+
+
+def measure(module: str) -> Tuple[List[Tuple[str, int, int]], Set[str]]:
+    """import a module in a fresh interpreter.
+
+    returns (name, self_us, cumulative_us) rows plus the modules actually loaded; -X importtime
+    also logs failed optional imports (e.g. starlette probing for multipart) so those can't be
+    used to decide what was loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import sys, {module}; print('\\n'.join(sys.modules))"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(f"failed to import {module}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        # drop the single separator space so top-level imports have no indentation
+        rows.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return rows, set(result.stdout.split())
+
+
+def total_us(rows: List[Tuple[str, int, int]], module: str) -> int:
+    """cumulative time of the measured module, excluding interpreter startup (site, encodings, ...)."""
+    package = module.split(".")[0]
+    return sum(
+        cumulative
+        for name, _, cumulative in rows
+        if not name.startswith(" ") and name.split(".")[0] == package
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.main", help="module to import (default: app.main)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="fail above this many ms")
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh interpreters to measure")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest imports to print")
+    args = parser.parse_args()
+
+    totals = []
+    slowest: Dict[str, int] = {}
+    loaded: Set[str] = set()
+    for _ in range(args.runs):
+        rows, modules = measure(args.module)
+        loaded |= modules
+        totals.append(total_us(rows, args.module))
+        for name, _, cumulative in rows:
+            name = name.strip()
+            slowest[name] = min(cumulative, slowest.get(name, cumulative))
+
+    total_ms = statistics.median(totals) / 1000
+
+    print(f"import {args.module}: median {total_ms:.1f} ms over {args.runs} runs (budget {args.budget_ms:.0f} ms)")
+    print(f"{'cumulative ms':>14}  module")
+    for name, cumulative in sorted(slowest.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"{cumulative / 1000:>14.1f}  {name}")
+
+    failed = False
+    eager = sorted({name.split(".")[0] for name in loaded} & set(FORBIDDEN_AT_STARTUP))
+    if eager:
+        print(f"FAIL: lazily-loaded modules imported at startup: {', '.join(eager)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"FAIL: import time {total_ms:.1f} ms exceeds budget of {args.budget_ms:.0f} ms")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""tests for serving the vite build with StaticAssets."""
+
+import asyncio
+import gzip
+from typing import Dict, Tuple
+
+import pytest
+from fastapi import FastAPI
+
+from app.services import StaticAssets
+
+JS_NAME = "assets/index-4f1b2c3d.js"
+JS = b"console.log('hello');" * 100
+INDEX = b"<!doctype html><div id='root'></div>"
+
+
+@pytest.fixture
+def app(tmp_path):
+    """fastapi app with an api route and a StaticAssets mount over a small vite-like build."""
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_bytes(INDEX)
+    (tmp_path / JS_NAME).write_bytes(JS)
+    (tmp_path / f"{JS_NAME}.gz").write_bytes(gzip.compress(JS))
+    (tmp_path / f"{JS_NAME}.br").write_bytes(b"fake brotli")
+    (tmp_path / "favicon-darkmode.svg").write_bytes(b"<svg/>")
+    (tmp_path / "big.bin").write_bytes(b"x" * 2048)
+
+    api = FastAPI()
+
+    @api.get("/api/v1/health")
+    async def health():
+        return {"status": "healthy"}
+
+    api.mount("/", StaticAssets(directory=str(tmp_path), max_memory_size=1024), name="static")
+    return api
+
+
+def request(app, path: str, method: str = "GET", **headers: str) -> Tuple[int, Dict[str, str], bytes]:
+    """send one request through the asgi app and return (status, headers, body)."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("testserver", 80),
+    }
+    response: Dict = {"status": 0, "headers": {}, "body": b""}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {k.decode(): v.decode() for k, v in message["headers"]}
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+
+    asyncio.run(app(scope, receive, send))
+    return response["status"], response["headers"], response["body"]
+
+
+def test_index_is_served_with_short_ttl(app):
+    status, headers, body = request(app, "/")
+    assert status == 200
+    assert body == INDEX
+    assert headers["cache-control"] == "public, max-age=60, must-revalidate"
+    assert headers["content-type"].startswith("text/html")
+
+
+def test_hashed_asset_is_immutable(app):
+    status, headers, body = request(app, f"/{JS_NAME}")
+    assert status == 200
+    assert body == JS
+    assert "immutable" in headers["cache-control"]
+    assert headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in headers
+
+
+def test_hashed_looking_name_outside_assets_dir_is_not_immutable(app):
+    status, headers, _ = request(app, "/favicon-darkmode.svg")
+    assert status == 200
+    assert headers["cache-control"] == "public, max-age=60, must-revalidate"
+
+
+def test_precompressed_variant_is_preferred(app):
+    status, headers, body = request(app, f"/{JS_NAME}", accept_encoding="gzip, br")
+    assert status == 200
+    assert headers["content-encoding"] == "br"
+    assert body == b"fake brotli"
+
+    status, headers, body = request(app, f"/{JS_NAME}", accept_encoding="gzip")
+    assert headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == JS
+
+
+def test_encoding_refused_with_q_zero(app):
+    status, headers, body = request(app, f"/{JS_NAME}", accept_encoding="br;q=0, gzip;q=0.0")
+    assert status == 200
+    assert "content-encoding" not in headers
+    assert body == JS
+
+
+def test_precompressed_siblings_are_not_served_directly_as_assets(app):
+    _, identity, _ = request(app, f"/{JS_NAME}")
+    _, gzipped, _ = request(app, f"/{JS_NAME}", accept_encoding="gzip")
+    assert identity["etag"] != gzipped["etag"]
+
+    status, _, _ = request(app, f"/{JS_NAME}.gz")
+    assert status == 404
+
+
+def test_if_none_match_returns_304(app):
+    _, headers, _ = request(app, f"/{JS_NAME}", accept_encoding="gzip")
+    status, headers, body = request(app, f"/{JS_NAME}", accept_encoding="gzip", if_none_match=headers["etag"])
+    assert status == 304
+    assert body == b""
+
+    status, _, _ = request(app, f"/{JS_NAME}", if_none_match='"stale"')
+    assert status == 200
+
+
+def test_head_has_headers_but_no_body(app):
+    status, headers, body = request(app, f"/{JS_NAME}", method="HEAD")
+    assert status == 200
+    assert headers["content-length"] == str(len(JS))
+    assert body == b""
+
+
+def test_large_file_is_streamed_from_disk(app):
+    status, headers, body = request(app, "/big.bin")
+    assert status == 200
+    assert body == b"x" * 2048
+    assert headers["content-length"] == "2048"
+
+
+@pytest.mark.parametrize("path", ["/about", "/projects/ksim", "/about/"])
+def test_client_routes_fall_back_to_index(app, path):
+    status, headers, body = request(app, path)
+    assert status == 200
+    assert body == INDEX
+    assert headers["cache-control"] == "public, max-age=60, must-revalidate"
+
+
+@pytest.mark.parametrize("path", ["/assets/missing-12345678.js", "/api/v1/nope", "/api", "/docs/nope", "/redoc/nope"])
+def test_missing_files_and_api_paths_404(app, path):
+    status, headers, _ = request(app, path)
+    assert status == 404
+    assert headers["content-type"] == "application/json"
+
+
+def test_api_routes_are_not_shadowed(app):
+    status, _, body = request(app, "/api/v1/health")
+    assert status == 200
+    assert body == b'{"status":"healthy"}'
+
+
+def test_only_get_and_head_are_allowed(app):
+    status, _, _ = request(app, "/", method="POST")
+    assert status == 405
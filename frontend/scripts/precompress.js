@@ -0,0 +1,35 @@
+// writes .br and .gz siblings next to compressible files in the vite build so the
+// backend can serve them without compressing on every request.
+import { readdirSync, readFileSync, statSync, writeFileSync } from 'node:fs'
+import { extname, join } from 'node:path'
+import { brotliCompressSync, constants, gzipSync } from 'node:zlib'
+
+const COMPRESSIBLE = new Set(['.html', '.js', '.mjs', '.css', '.json', '.svg', '.txt', '.xml', '.map', '.wasm'])
+const MIN_SIZE = 1024
+
+function walk(dir) {
+  return readdirSync(dir).flatMap((name) => {
+    const path = join(dir, name)
+    return statSync(path).isDirectory() ? walk(path) : [path]
+  })
+}
+
+const dir = process.argv[2] ?? 'dist'
+for (const path of walk(dir)) {
+  if (!COMPRESSIBLE.has(extname(path))) continue
+
+  const source = readFileSync(path)
+  if (source.length < MIN_SIZE) continue
+
+  const br = brotliCompressSync(source, {
+    params: {
+      [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY,
+      [constants.BROTLI_PARAM_SIZE_HINT]: source.length,
+    },
+  })
+  const gz = gzipSync(source, { level: 9 })
+
+  // only keep variants that actually save bytes
+  if (br.length < source.length) writeFileSync(`${path}.br`, br)
+  if (gz.length < source.length) writeFileSync(`${path}.gz`, gz)
+}